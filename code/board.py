@@ -1,11 +1,31 @@
 """
 File: board.py
 Provides a QFrame-based Board class with drawing logic for a Go board.
-It supports storing stone placements in a 2D grid structure.
+It stores stone placements in a flat, row-major int8 array.
 """
+from array import array
+
 from PyQt6.QtWidgets import QFrame
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer, QTime
-from PyQt6.QtGui import QPainter, QColor, QBrush, QPen, QRadialGradient
+from PyQt6.QtCore import Qt, QSize, QRect, QLineF, pyqtSignal, pyqtSlot, QTimer, QTime
+from PyQt6.QtGui import QPainter, QColor, QBrush, QPen, QRadialGradient, QPixmap
+
+
+class Animation:
+    """
+    A single running board animation (stone placement, capture or winner overlay).
+    Uses __slots__ so the per-frame field reads are plain attribute loads.
+    """
+    __slots__ = ("row", "col", "piece", "anim_type", "start_time", "duration", "inv_duration")
+
+    def __init__(self, row, col, piece, anim_type, start_time, duration):
+        self.row = row
+        self.col = col
+        self.piece = piece
+        self.anim_type = anim_type
+        self.start_time = start_time
+        self.duration = duration
+        self.inv_duration = 1.0 / duration
+
 
 class Board(QFrame):
     stonePlaced = pyqtSignal(int, int)  # Signal emitted with row, col of the placed stone
@@ -13,90 +33,165 @@ class Board(QFrame):
     def __init__(self, size):
         super().__init__()
         self.size = size
-        self.grid = [[0] * size for _ in range(size)]  # 0 = empty, 1 = Black, -1 = White
+        # Flat row-major grid, one signed byte per cell: 0 = empty, 1 = Black, -1 = White
+        self.grid = array('b', bytes(size * size))
+        self._empty_grid = array('b', bytes(size * size))  # Zero template copied in by reset()
         self.cell_size = 60
+        self._bg_pixmap = None  # Cached board background, rebuilt when the widget is resized
+        self._stone_pixmaps = {}  # Pre-rendered full-size stones keyed by piece (1 / -1)
+
+        # Geometry shared by the drawing and hit-testing code
+        self._half = self.cell_size // 2
+        self._base_radius = self._half - 5
+        # Pixel coordinate of the intersection line for each row/column index
+        self._centers = [i * self.cell_size + self._half for i in range(size)]
+
+        # All vertical and horizontal grid lines, submitted to the painter in one drawLines call
+        near = self._centers[0]
+        far = self._centers[-1]
+        self._grid_lines = []
+        for pos in self._centers:
+            self._grid_lines.append(QLineF(pos, near, pos, far))
+            self._grid_lines.append(QLineF(near, pos, far, pos))
+
+        # Full-size, opaque stone brushes centred on the origin; reused for every static stone
+        self._black_brush = self._stone_brush(1, 0, 0, self._base_radius, 255)
+        self._white_brush = self._stone_brush(-1, 0, 0, self._base_radius, 255)
+        # Brushes for animated stones, keyed by (piece, alpha_step, size_step); see draw_stone
+        self._brush_cache = {}
 
         # Animations
-        self.animations = []
+        # Active animations keyed by (anim_type, row, col); the winner overlay uses (-1, -1)
+        self.animations = {}
         self.animation_timer = QTimer(self)
         self.animation_timer.setInterval(16)  # ~60 FPS
         self.animation_timer.timeout.connect(self.update_animations)
-        self.animation_timer.start()
+        # The timer only runs while there are animations to play (see _start_animation_timer)
 
     def animate_piece_placement(self, row, col, piece):
-        anim = {
-            "row": row,
-            "col": col,
-            "piece": piece,
-            "anim_type": "placement",
-            "start_time": QTime.currentTime().msecsSinceStartOfDay(),
-            "duration": 250
-        }
-        self.animations.append(anim)
+        anim = Animation(row, col, piece, "placement",
+                         QTime.currentTime().msecsSinceStartOfDay(), 250)
+        self.animations[("placement", row, col)] = anim
+        self._start_animation_timer()
+        self.update_cell(row, col)
 
     def animate_capture(self, captured_positions, captured_piece_color):
         start_t = QTime.currentTime().msecsSinceStartOfDay()
         for (r, c) in captured_positions:
-            anim = {
-                "row": r,
-                "col": c,
-                "piece": captured_piece_color,
-                "anim_type": "capture",
-                "start_time": start_t,
-                "duration": 500
-            }
-            self.animations.append(anim)
+            anim = Animation(r, c, captured_piece_color, "capture", start_t, 500)
+            self.animations[("capture", r, c)] = anim
+        if captured_positions:
+            self._start_animation_timer()
 
     def animate_winner(self, winner_name):
         piece_val = 1 if winner_name == "Black" else -1
-        anim = {
-            "row": -1,
-            "col": -1,
-            "piece": piece_val,
-            "anim_type": "winner",
-            "start_time": QTime.currentTime().msecsSinceStartOfDay(),
-            "duration": 5000
-        }
-        self.animations.append(anim)
+        anim = Animation(-1, -1, piece_val, "winner",
+                         QTime.currentTime().msecsSinceStartOfDay(), 5000)
+        self.animations[("winner", -1, -1)] = anim
+        self._start_animation_timer()
+
+    def _start_animation_timer(self):
+        if not self.animation_timer.isActive():
+            self.animation_timer.start()
 
+    @pyqtSlot()
     def update_animations(self):
         now = QTime.currentTime().msecsSinceStartOfDay()
-        ongoing = []
-        for anim in self.animations:
-            elapsed = now - anim["start_time"]
-            if elapsed < anim["duration"]:
-                ongoing.append(anim)
-        self.animations = ongoing
-        self.update()
+        dirty = QRect()
+        full_repaint = False
+        for key, anim in list(self.animations.items()):
+            # Expired animations still need one last repaint of their area
+            if anim.anim_type == "winner":
+                full_repaint = True
+            else:
+                dirty = dirty.united(self._cell_rect(anim.row, anim.col))
+            elapsed = now - anim.start_time
+            if elapsed >= anim.duration:
+                del self.animations[key]
+        if not self.animations:
+            self.animation_timer.stop()
+
+        if full_repaint:
+            self.update()
+        elif not dirty.isNull():
+            self.update(dirty)
 
     def reset(self):
-        self.grid = [[0] * self.size for _ in range(self.size)]
+        self.grid[:] = self._empty_grid
         self.animations.clear()
+        self.animation_timer.stop()
         self.update()
 
+    def get_cell(self, row, col):
+        return self.grid[row * self.size + col]
+
+    def set_cell(self, row, col, value):
+        """
+        Write a cell without animating or repainting; callers batch their
+        writes and call update() once.
+        """
+        self.grid[row * self.size + col] = value
+
+    def update_cell(self, row, col):
+        """
+        Schedule a repaint of just the cell at (row, col).
+        """
+        self.update(self._cell_rect(row, col))
+
     def place_stone(self, row, col, player):
-        if self.is_within_bounds(row, col) and self.grid[row][col] == 0:
-            self.grid[row][col] = player
-            self.animate_piece_placement(row, col, player)
-            self.update()
+        if self.is_within_bounds(row, col) and self.get_cell(row, col) == 0:
+            self.set_cell(row, col, player)
+            self.animate_piece_placement(row, col, player)  # Also schedules the cell repaint
             return True
         return False
 
     def remove_stone(self, row, col):
         if self.is_within_bounds(row, col):
-            self.grid[row][col] = 0
-            self.update()
+            self.set_cell(row, col, 0)
+            self.update_cell(row, col)
 
     def is_within_bounds(self, row, col):
-        return 0 <= row < self.size and 0 <= col < self.size
+        # row | col is negative iff either coordinate is negative
+        size = self.size
+        return (row | col) >= 0 and row < size and col < size
+
+    def _cell_rect(self, row, col):
+        """
+        Widget-space rectangle covering the cell at (row, col), padded by a few
+        pixels so antialiased stone edges are repainted too.
+        """
+        return QRect(col * self.cell_size, row * self.cell_size,
+                     self.cell_size, self.cell_size).adjusted(-4, -4, 4, 4)
 
     def paintEvent(self, event):
+        now = QTime.currentTime().msecsSinceStartOfDay()  # One clock read per frame
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        self.draw_board(painter)
-        self.draw_pieces(painter)
-        self.draw_animations(painter)
+        painter.drawPixmap(0, 0, self.background_pixmap())
+        self.draw_pieces(painter, event.rect())
+        self.draw_animations(painter, now)
+
+    def resizeEvent(self, event):
+        self._bg_pixmap = None
+        self._stone_pixmaps.clear()
+        super().resizeEvent(event)
+
+    def background_pixmap(self):
+        """
+        Return the board background (wood fill + grid lines), rendering it
+        into a pixmap only when there is no cached one for the current size.
+        """
+        if self._bg_pixmap is None:
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(self.rect().size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            bg_painter = QPainter(pixmap)
+            bg_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self.draw_board(bg_painter)
+            bg_painter.end()
+            self._bg_pixmap = pixmap
+        return self._bg_pixmap
 
     def draw_board(self, painter):
         painter.setBrush(QColor(210, 180, 140))  # Lighter wood texture
@@ -104,36 +199,69 @@ class Board(QFrame):
 
         pen = QPen(Qt.GlobalColor.black, 2)
         painter.setPen(pen)
-
-        for i in range(self.size):
-            x = i * self.cell_size + self.cell_size // 2
-            painter.drawLine(x, self.cell_size // 2, x, self.size * self.cell_size - self.cell_size // 2)
-
-            y = i * self.cell_size + self.cell_size // 2
-            painter.drawLine(self.cell_size // 2, y, self.size * self.cell_size - self.cell_size // 2, y)
-
-    def draw_pieces(self, painter):
-        for row in range(self.size):
-            for col in range(self.size):
-                piece = self.grid[row][col]
-                if piece == 0:
-                    continue
-
-                is_anim_placement = any(
-                    (a["row"] == row and a["col"] == col and a["anim_type"] == "placement")
-                    for a in self.animations
-                )
-                if is_anim_placement:
-                    continue
-
-                self.draw_stone(painter, row, col, piece, size_factor=1.0, alpha_val=255)
-
-    def draw_stone(self, painter, row, col, piece, size_factor=1.0, alpha_val=255):
-        center_x = col * self.cell_size + self.cell_size // 2
-        center_y = row * self.cell_size + self.cell_size // 2
-        base_radius = (self.cell_size // 2) - 5
-        radius = base_radius * size_factor
-
+        painter.drawLines(self._grid_lines)
+
+    def draw_pieces(self, painter, exposed=None):
+        # Collect static stones per colour, then draw each colour in one pass.
+        # When an exposed rect is given, only cells overlapping it are drawn.
+        animations = self.animations
+        size = self.size
+        first_row = first_col = 0
+        last_row = last_col = size - 1
+        if exposed is not None:
+            # Same padding as _cell_rect
+            first_row = max(0, (exposed.top() - 4) // self.cell_size)
+            last_row = min(size - 1, (exposed.bottom() + 4) // self.cell_size)
+            first_col = max(0, (exposed.left() - 4) // self.cell_size)
+            last_col = min(size - 1, (exposed.right() + 4) // self.cell_size)
+        black_cells = []
+        white_cells = []
+        for idx, piece in enumerate(self.grid):
+            if piece == 0:
+                continue
+            row, col = divmod(idx, size)
+            if not (first_row <= row <= last_row and first_col <= col <= last_col):
+                continue
+            # Stones still growing in are drawn by draw_animations instead
+            if ("placement", row, col) in animations:
+                continue
+            (black_cells if piece == 1 else white_cells).append((row, col))
+
+        # Static stones are blitted from pre-rendered pixmaps
+        offset = self._base_radius + 1
+        centers = self._centers
+        for piece, cells in ((1, black_cells), (-1, white_cells)):
+            if not cells:
+                continue
+            pixmap = self.stone_pixmap(piece)
+            for row, col in cells:
+                painter.drawPixmap(centers[col] - offset, centers[row] - offset, pixmap)
+
+    def stone_pixmap(self, piece):
+        """
+        Return a full-size, opaque stone of the given color rendered into a
+        transparent pixmap (with a 1px margin for antialiasing), building it
+        on first use.
+        """
+        pixmap = self._stone_pixmaps.get(piece)
+        if pixmap is None:
+            radius = self._base_radius
+            ratio = self.devicePixelRatioF()
+            side = radius * 2 + 2
+            pixmap = QPixmap(int(side * ratio), int(side * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            stone_painter = QPainter(pixmap)
+            stone_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            stone_painter.setPen(Qt.GlobalColor.transparent)
+            stone_painter.setBrush(self._black_brush if piece == 1 else self._white_brush)
+            stone_painter.setBrushOrigin(radius + 1, radius + 1)
+            stone_painter.drawEllipse(1, 1, radius * 2, radius * 2)
+            stone_painter.end()
+            self._stone_pixmaps[piece] = pixmap
+        return pixmap
+
+    def _stone_brush(self, piece, center_x, center_y, radius, alpha_val):
         gradient = QRadialGradient(center_x, center_y, radius)
         if piece == 1:  # Black
             gradient.setColorAt(0, QColor(50, 50, 50, alpha_val))
@@ -141,10 +269,33 @@ class Board(QFrame):
         else:  # White
             gradient.setColorAt(0, QColor(255, 255, 255, alpha_val))
             gradient.setColorAt(1, QColor(200, 200, 200, alpha_val))
+        return QBrush(gradient)
 
-        painter.setBrush(QBrush(gradient))
+    def draw_stone(self, painter, row, col, piece, size_factor=1.0, alpha_val=255):
+        center_x = self._centers[col]
+        center_y = self._centers[row]
+
+        if size_factor == 1.0 and alpha_val == 255:
+            radius = self._base_radius
+            brush = self._black_brush if piece == 1 else self._white_brush
+        else:
+            # Animated stones are quantized to 8 size and 8 alpha steps so their
+            # brushes can be built once and reused across frames.
+            size_step = int(size_factor * 8)
+            if size_step <= 0:
+                return
+            alpha_step = alpha_val >> 5
+            radius = self._base_radius * size_step / 8
+            key = (piece, alpha_step, size_step)
+            brush = self._brush_cache.get(key)
+            if brush is None:
+                brush = self._stone_brush(piece, 0, 0, radius, (alpha_step << 5) + 31)
+                self._brush_cache[key] = brush
+
+        # Brushes are centred on the origin; move the brush under this stone
+        painter.setBrush(brush)
+        painter.setBrushOrigin(center_x, center_y)
         painter.setPen(Qt.GlobalColor.transparent)
-
         painter.drawEllipse(
             int(center_x - radius),
             int(center_y - radius),
@@ -152,13 +303,12 @@ class Board(QFrame):
             int(radius * 2)
         )
 
-    def draw_animations(self, painter):
-        now = QTime.currentTime().msecsSinceStartOfDay()
-        for anim in self.animations:
-            elapsed = now - anim["start_time"]
-            progress = min(elapsed / anim["duration"], 1.0)
-            atype = anim["anim_type"]
-            piece = anim["piece"]
+    def draw_animations(self, painter, now):
+        for anim in self.animations.values():
+            elapsed = now - anim.start_time
+            progress = min(elapsed * anim.inv_duration, 1.0)
+            atype = anim.anim_type
+            piece = anim.piece
 
             if atype == "winner":
                 alpha = int(255 * (1.0 - progress))
@@ -170,7 +320,7 @@ class Board(QFrame):
                 painter.drawRect(self.rect())
 
             else:
-                row, col = anim["row"], anim["col"]
+                row, col = anim.row, anim.col
                 if atype == "placement":
                     size_factor = progress
                     alpha_val = int(255 * progress)
@@ -191,17 +341,20 @@ class Board(QFrame):
         x = event.pos().x()
         y = event.pos().y()
 
-        col = round((x - self.cell_size // 2) / self.cell_size)
-        row = round((y - self.cell_size // 2) / self.cell_size)
+        # Intersections sit half a cell in, so rounding to the nearest one is
+        # the same as integer-dividing the unshifted coordinate.
+        col = x // self.cell_size
+        row = y // self.cell_size
 
-        if 0 <= row < self.size and 0 <= col < self.size:
+        if self.is_within_bounds(row, col):
             self.stonePlaced.emit(row, col)
 
     def __repr__(self):
+        glyphs = "○.●"  # indexed by cell + 1: White, empty, Black
+        size = self.size
+        cells = [glyphs[cell + 1] for cell in self.grid]
         board_representation = "\n".join(
-            [
-                " ".join("●" if cell == 1 else "○" if cell == -1 else "." for cell in row)
-                for row in self.grid
-            ]
+            " ".join(cells[start:start + size])
+            for start in range(0, len(cells), size)
         )
         return f"Board:\n{board_representation}"
@@ -10,18 +10,157 @@ Defines the main QMainWindow class (GoGame) for the Go GUI:
 - Handicap stones
 """
 
+import math
+import time
+from collections import deque
+from functools import partial
+
 from PyQt6.QtWidgets import (
-    QMainWindow, QVBoxLayout, QLabel, QGridLayout, QPushButton,
+    QApplication, QMainWindow, QVBoxLayout, QLabel, QGridLayout, QPushButton,
     QWidget, QMessageBox, QMenuBar, QHBoxLayout, QSizePolicy
 )
-from PyQt6.QtCore import QSize, Qt, QTimer
+from PyQt6.QtCore import QObject, QSize, Qt, QTimer, pyqtSlot
 from PyQt6.QtGui import QAction, QFont
 from logic import GameLogic
 from board import Board
 
+MAX_HISTORY = 512  # Oldest moves beyond this are dropped from the undo/redo stacks
+# "mm:ss" text for every clock value a player can have (0..120 seconds)
+CLOCK_TEXT = tuple(f"{s // 60:02}:{s % 60:02}" for s in range(121))
+# Window stylesheets for each theme, selected by apply_theme
+THEME_STYLESHEETS = {
+    "light": """
+    QMainWindow {
+        background-color: #FFFFFF;
+    }
+    QLabel {
+        color: #000000;
+    }
+    QPushButton {
+        background-color: #D3D3D3;
+        color: #000000;
+        border-radius: 10px;
+        padding: 10px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #B0C4DE;
+    }
+""",
+    "dark": """
+    QMainWindow {
+        background-color: #2D2D2D;
+    }
+    QLabel {
+        color: #FFFFFF;
+    }
+    QPushButton {
+        background-color: #3333CC;
+        color: #FFFFFF;
+        border-radius: 10px;
+        padding: 10px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #5555FF;
+    }
+""",
+}
+# Bits for GoGame._mark_dirty: which label groups need refreshing
+DIRTY_LABELS = 1  # turn and score labels (update_labels)
+DIRTY_TIMER = 2   # clock labels (update_timer_labels)
+# Repeat clicks on a control button within this many ms are dropped (see Throttle)
+BUTTON_THROTTLE_MS = 150
+
+
+class Throttle(QObject):
+    """
+    Forwards trigger() to a no-argument slot, ignoring calls that arrive within
+    msec of the last accepted one (leading edge: the first call runs immediately).
+    trigger is a real pyqtSlot, so signals connect to it like to the decorated GoGame slots.
+    """
+
+    def __init__(self, slot, msec, parent):
+        super().__init__(parent)
+        self._slot = slot
+        self._interval = msec / 1000
+        self._last_call = float("-inf")
+
+    @pyqtSlot()
+    def trigger(self):
+        now = time.monotonic()
+        if now - self._last_call < self._interval:
+            return
+        self._last_call = now
+        self._slot()
+
+
+class PlaceCommand:
+    """
+    One played move on the undo/redo stacks. The move is stored compactly as
+    move_index = row * size + col and a captured_mask with one bit per captured
+    stone; undo()/redo() apply it to a GameLogic from that record alone.
+    """
+    __slots__ = ("move_index", "player", "captured_mask")
+
+    def __init__(self, size, row, col, player, captured_positions):
+        captured_mask = 0
+        for (r, c) in captured_positions:
+            captured_mask |= 1 << (r * size + c)
+        self.move_index = row * size + col
+        self.player = player
+        self.captured_mask = captured_mask
+
+    def positions(self, size):
+        """
+        Decode the record into (row, col, captured_positions).
+        """
+        captured_positions = []
+        captured_mask = self.captured_mask
+        while captured_mask:
+            lowest = captured_mask & -captured_mask
+            captured_positions.append(divmod(lowest.bit_length() - 1, size))
+            captured_mask ^= lowest
+        row, col = divmod(self.move_index, size)
+        return row, col, captured_positions
+
+    def undo(self, logic):
+        """
+        Take the move back; returns the (row, col, value) cell changes.
+        """
+        row, col, captured_positions = self.positions(logic.board_size)
+        logic.undo_stone(row, col, self.player, captured_positions)
+        changes = [(r, c, -self.player) for (r, c) in captured_positions]
+        changes.append((row, col, 0))
+        return changes
+
+    def redo(self, logic):
+        """
+        Replay the move; returns (row, col, captured_positions), or None if the
+        move is no longer legal. The record is updated to the captures actually made.
+        """
+        size = logic.board_size
+        row, col, captured_positions = self.positions(size)
+        captured_positions = logic.replay_stone(row, col, self.player, captured_positions)
+        if captured_positions is None:
+            return None
+        captured_mask = 0
+        for (r, c) in captured_positions:
+            captured_mask |= 1 << (r * size + c)
+        self.captured_mask = captured_mask
+        return row, col, captured_positions
+
+
 class GoGame(QMainWindow):
+    # Label fonts, built on first use (a QApplication must exist) and shared by every window
+    _title_font = None
+    _label_font = None
+
     def __init__(self):
         super().__init__()
+        if GoGame._title_font is None:
+            GoGame._title_font = QFont("Arial", 16, QFont.Weight.Bold)
+            GoGame._label_font = QFont("Arial", 14)
         self.setWindowTitle("Go Game - 7x7 Board")
         self.resize(QSize(800, 900))
 
@@ -29,12 +168,36 @@ class GoGame(QMainWindow):
         self.current_theme = "light"
         self.apply_theme()
 
+        # Each side has a 120-second bank for the whole game; black_timer and
+        # white_timer are the whole seconds shown, _time_left the exact bank
         self.black_timer = 120
         self.white_timer = 120
+        self._time_left = {"black": 120.0, "white": 120.0}
         self.current_timer = None
-
+        # time.monotonic() at which the running clock reaches zero; the clock
+        # value is derived from it on each tick so missed or late ticks never drift
+        self._deadline = None
+        # Clock values the two timer labels currently display
+        self._shown_black_timer = 120
+        self._shown_white_timer = 120
+
+        # One long-lived coarse timer; moves only move the deadline, they never restart it
         self.timer = QTimer()
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.timer.setInterval(1000)
         self.timer.timeout.connect(self.update_timer)
+        QApplication.instance().applicationStateChanged.connect(self.on_application_state_changed)
+
+        # Set while a board click is being handled; cleared from the event loop so
+        # clicks queued behind it (e.g. a double-click) are dropped, not replayed
+        self._input_locked = False
+
+        # Pending DIRTY_* bits, flushed once per event-loop pass by _flush_dirty
+        self._dirty = 0
+
+        # Reused message boxes, one per severity, instead of a new dialog per message
+        self._warn_box = QMessageBox(QMessageBox.Icon.Warning, "", "", parent=self)
+        self._info_box = QMessageBox(QMessageBox.Icon.Information, "", "", parent=self)
 
         self.create_menu()
 
@@ -45,24 +208,26 @@ class GoGame(QMainWindow):
 
         # Turn Label
         self.turn_label = QLabel("Black's Turn")
-        self.turn_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        self._shown_turn_text = self.turn_label.text()
+        self.turn_label.setFont(self._title_font)
         self.turn_label.setStyleSheet("margin-bottom: 10px;")
         main_layout.addWidget(self.turn_label, alignment=Qt.AlignmentFlag.AlignCenter)
 
         # Score Label
         self.score_label = QLabel("Black: 0 | White: 0")
-        self.score_label.setFont(QFont("Arial", 14))
+        self._shown_score_text = self.score_label.text()
+        self.score_label.setFont(self._label_font)
         self.score_label.setStyleSheet("margin-bottom: 20px;")
         main_layout.addWidget(self.score_label, alignment=Qt.AlignmentFlag.AlignCenter)
 
         # Timer Labels
         self.black_timer_label = QLabel("Black Timer: 02:00")
-        self.black_timer_label.setFont(QFont("Arial", 14))
+        self.black_timer_label.setFont(self._label_font)
         self.black_timer_label.setStyleSheet("margin-bottom: 5px;")
         main_layout.addWidget(self.black_timer_label, alignment=Qt.AlignmentFlag.AlignCenter)
 
         self.white_timer_label = QLabel("White Timer: 02:00")
-        self.white_timer_label.setFont(QFont("Arial", 14))
+        self.white_timer_label.setFont(self._label_font)
         self.white_timer_label.setStyleSheet("margin-bottom: 20px;")
         main_layout.addWidget(self.white_timer_label, alignment=Qt.AlignmentFlag.AlignCenter)
 
@@ -80,14 +245,15 @@ class GoGame(QMainWindow):
         button_layout = QHBoxLayout()
         button_layout.setSpacing(20)
 
+        # PASS/UNDO/REDO drop accidental double-clicks; a double PASS would end the game
         self.pass_button = QPushButton("PASS")
-        self.pass_button.clicked.connect(self.pass_turn)
+        self.pass_button.clicked.connect(Throttle(self.pass_turn, BUTTON_THROTTLE_MS, self).trigger)
 
         self.undo_button = QPushButton("UNDO")
-        self.undo_button.clicked.connect(self.undo_move)
+        self.undo_button.clicked.connect(Throttle(self.undo_move, BUTTON_THROTTLE_MS, self).trigger)
 
         self.redo_button = QPushButton("REDO")
-        self.redo_button.clicked.connect(self.redo_move)
+        self.redo_button.clicked.connect(Throttle(self.redo_move, BUTTON_THROTTLE_MS, self).trigger)
 
         self.reset_button = QPushButton("RESET")
         self.reset_button.clicked.connect(self.reset_game)
@@ -99,11 +265,16 @@ class GoGame(QMainWindow):
         main_layout.addLayout(button_layout)
 
         self.board_size = 7
-        self.buttons = {}
-        self.move_history = []
-        self.redo_stack = []
+        last = self.board_size - 1
+        # Corner points used by apply_handicap, in placement order
+        self._handicap_coords = ((0, 0), (0, last), (last, 0), (last, last))
+        # Undo/redo entries are PlaceCommand records
+        self.move_history = deque(maxlen=MAX_HISTORY)
+        self.redo_stack = deque(maxlen=MAX_HISTORY)
 
         self.logic = GameLogic(self.board_size)
+        # (black, white) bitboards the Board widget currently shows, see update_board_ui
+        self._shown_bitboards = (0, 0)
 
         # Board Widget
         self.board_widget = Board(self.board_size)
@@ -125,10 +296,10 @@ class GoGame(QMainWindow):
 
         handicap_menu = menu_bar.addMenu("Handicap")
         handicap_2_action = QAction("Handicap 2 Stones", self)
-        handicap_2_action.triggered.connect(lambda: self.apply_handicap(2))
+        handicap_2_action.triggered.connect(partial(self.apply_handicap, 2))
         handicap_menu.addAction(handicap_2_action)
         handicap_3_action = QAction("Handicap 3 Stones", self)
-        handicap_3_action.triggered.connect(lambda: self.apply_handicap(3))
+        handicap_3_action.triggered.connect(partial(self.apply_handicap, 3))
         handicap_menu.addAction(handicap_3_action)
 
         # Theme menu
@@ -138,49 +309,14 @@ class GoGame(QMainWindow):
         theme_menu.addAction(toggle_theme_action)
 
     def apply_theme(self):
-        if self.current_theme == "light":
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #FFFFFF;
-                }
-                QLabel {
-                    color: #000000;
-                }
-                QPushButton {
-                    background-color: #D3D3D3;
-                    color: #000000;
-                    border-radius: 10px;
-                    padding: 10px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #B0C4DE;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #2D2D2D;
-                }
-                QLabel {
-                    color: #FFFFFF;
-                }
-                QPushButton {
-                    background-color: #3333CC;
-                    color: #FFFFFF;
-                    border-radius: 10px;
-                    padding: 10px;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #5555FF;
-                }
-            """)
+        self.setStyleSheet(THEME_STYLESHEETS[self.current_theme])
 
+    @pyqtSlot()
     def toggle_theme(self):
         self.current_theme = "dark" if self.current_theme == "light" else "light"
         self.apply_theme()
 
+    @pyqtSlot()
     def show_how_to_play(self):
         rules = (
             "Go Game Rules:\n"
@@ -192,40 +328,53 @@ class GoGame(QMainWindow):
             "- https://www.britgo.org/intro/intro2.html\n"
             "- https://www.youtube.com/watch?v=Jq5SObMdV3o"
         )
-        QMessageBox.information(self, "How to Play", rules)
+        self.show_message(self._info_box, "How to Play", rules)
+
+    def show_message(self, box, title, text):
+        """
+        Show text in one of the cached message boxes (_warn_box / _info_box).
+        If that box is already open (a message arriving from a timer while the
+        user reads another), a new box is used so the open one keeps its text.
+        """
+        if box.isVisible():
+            box = QMessageBox(box.icon(), title, text, parent=self)
+            box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec()
 
     def apply_handicap(self, stones_count):
-        state = self.logic.get_board_state()
-        any_stone = any(v != 0 for v in state.values())
-        if any_stone:
-            QMessageBox.warning(self, "Handicap Error", "Handicap can only be applied on an empty board.")
+        if self.logic.stone_count:
+            self.show_message(self._warn_box, "Handicap Error", "Handicap can only be applied on an empty board.")
             return
 
-        coords = [(0, 0), (0, self.board_size - 1),
-                  (self.board_size - 1, 0), (self.board_size - 1, self.board_size - 1)]
-
-        original_player = self.logic.get_current_player()
-        self.logic.current_player = 1  # black
-        for i in range(min(stones_count, len(coords))):
-            r, c = coords[i]
-            result = self.logic.place_stone(r, c)
-            if result is None:
-                break
-            self.logic.current_player = 1
-        self.logic.current_player = original_player
+        self.logic.place_handicap(self._handicap_coords[:stones_count])
+        # Handicap stones are not part of the move history, so nothing can be redone over them
+        self.redo_stack.clear()
 
         self.update_board_ui()
-        self.update_labels()
+        self._mark_dirty(DIRTY_LABELS)
 
+    @pyqtSlot(int, int)
     def place_stone(self, row, col):
-        captured_positions = self.logic.place_stone(row, col)
+        if self._input_locked:
+            return
+        self._input_locked = True
+        QTimer.singleShot(0, self._unlock_input)
+
+        # An occupied intersection can never be legal; skip the rules engine
+        if self.board_widget.get_cell(row, col) != 0:
+            captured_positions = None
+        else:
+            captured_positions = self.logic.place_stone(row, col)
         if captured_positions is None:
-            QMessageBox.warning(self, "Invalid Move", "This move is not valid.")
+            self.show_message(self._warn_box, "Invalid Move", "This move is not valid.")
             return
 
-        just_played = self.logic.get_current_player() * -1
+        just_played = -self.logic.get_current_player()
 
-        self.move_history.append((row, col, just_played, captured_positions))
+        self.move_history.append(
+            PlaceCommand(self.board_size, row, col, just_played, captured_positions))
         self.redo_stack.clear()
 
         if captured_positions:
@@ -233,57 +382,53 @@ class GoGame(QMainWindow):
 
         self.board_widget.place_stone(row, col, just_played)
 
-        if self.current_timer == "black":
-            self.white_timer = 120
-            self.current_timer = "white"
-        else:
-            self.black_timer = 120
-            self.current_timer = "black"
         self.start_timer()
 
-        self.update_board_ui()
-        self.update_labels()
-        self.update_timer_labels()
+        self.update_board_ui_delta([(r, c, 0) for (r, c) in captured_positions])
+        self._mark_dirty(DIRTY_LABELS | DIRTY_TIMER)
 
+    @pyqtSlot()
+    def _unlock_input(self):
+        self._input_locked = False
+
+    @pyqtSlot()
     def undo_move(self):
         if not self.move_history:
-            QMessageBox.warning(self, "Undo Error", "No moves to undo.")
+            self.show_message(self._warn_box, "Undo Error", "No moves to undo.")
             return
 
-        last_move = self.move_history.pop()
-        row, col, player_of_move, captured_positions = last_move
+        command = self.move_history.pop()
+        changes = command.undo(self.logic)
+        self.redo_stack.append(command)
 
-        self.logic.undo_stone(row, col, player_of_move, captured_positions)
-        self.redo_stack.append(last_move)
-
-        self.update_board_ui()
-        self.update_labels()
+        self.update_board_ui_delta(changes)
+        self._mark_dirty(DIRTY_LABELS)
 
+    @pyqtSlot()
     def redo_move(self):
         if not self.redo_stack:
-            QMessageBox.warning(self, "Redo Error", "No moves to redo.")
+            self.show_message(self._warn_box, "Redo Error", "No moves to redo.")
             return
 
-        move = self.redo_stack.pop()
-        row, col, player_of_move, captured_positions = move
-        original_player = self.logic.get_current_player()
-        self.logic.current_player = player_of_move
-
-        recaptured = self.logic.place_stone(row, col)
-        if recaptured is None:
-            self.logic.current_player = original_player
+        command = self.redo_stack.pop()
+        replayed = command.redo(self.logic)
+        if replayed is None:
+            # The board changed under the redo stack; the remaining entries are stale too
+            self.redo_stack.clear()
+            self.show_message(self._warn_box, "Redo Error", "This move can no longer be replayed.")
             return
-
-        self.move_history.append((row, col, player_of_move, recaptured))
-        self.logic.current_player = original_player
+        row, col, recaptured = replayed
+        self.move_history.append(command)
+        player_of_move = command.player
 
         if recaptured:
             self.board_widget.animate_capture(recaptured, -player_of_move)
         self.board_widget.place_stone(row, col, player_of_move)
 
-        self.update_board_ui()
-        self.update_labels()
+        self.update_board_ui_delta([(r, c, 0) for (r, c) in recaptured])
+        self._mark_dirty(DIRTY_LABELS)
 
+    @pyqtSlot()
     def reset_game(self):
         self.logic.reset_game()
         self.move_history.clear()
@@ -291,29 +436,24 @@ class GoGame(QMainWindow):
 
         self.black_timer = 120
         self.white_timer = 120
-        self.timer.stop()
+        self._time_left = {"black": 120.0, "white": 120.0}
+        self.current_timer = None
         self.start_timer()
-        self.update_timer_labels()
         self.update_board_ui()
-        self.update_labels()
+        self._mark_dirty(DIRTY_LABELS | DIRTY_TIMER)
 
+    @pyqtSlot()
     def pass_turn(self):
         self.logic.pass_turn()
-        if self.current_timer == "black":
-            self.white_timer = 120
-            self.current_timer = "white"
-        else:
-            self.black_timer = 120
-            self.current_timer = "black"
         self.start_timer()
 
         if self.logic.is_game_over():
             self.show_game_over()
         else:
-            self.update_labels()
-            self.update_timer_labels()
+            self._mark_dirty(DIRTY_LABELS | DIRTY_TIMER)
 
     def show_game_over(self):
+        self.pause_timer()
         territories = self.logic.calculate_territories()
         final_scores = self.logic.get_final_scores(territories)
         black_final = final_scores["black"]
@@ -329,55 +469,166 @@ class GoGame(QMainWindow):
             f"White = {white_final}\n\n"
             f"Winner: {winner}"
         )
-        QTimer.singleShot(2100, lambda: QMessageBox.information(self, "Game Over", msg))
+        QTimer.singleShot(2100, partial(self.show_message, self._info_box, "Game Over", msg))
 
     def start_timer(self):
+        """
+        Run the clock of the player to move. Whatever is left on the clock that
+        was running is banked for its owner; the QTimer itself keeps ticking.
+        """
+        now = time.monotonic()
+        if self.current_timer is not None and self._deadline is not None:
+            left = max(0.0, self._deadline - now)
+            self._time_left[self.current_timer] = left
+            if self.current_timer == "black":
+                self.black_timer = math.ceil(left)
+            else:
+                self.white_timer = math.ceil(left)
         self.current_timer = "black" if self.logic.get_current_player() == 1 else "white"
-        self.timer.start(1000)
+        self._deadline = now + self._time_left[self.current_timer]
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def pause_timer(self):
+        """
+        Stop the running clock for good (game over), banking what is left.
+        """
+        if self._deadline is None:
+            return
+        self.timer.stop()
+        self._time_left[self.current_timer] = max(0.0, self._deadline - time.monotonic())
+        self._deadline = None
+
+    def hideEvent(self, event):
+        # No clock ticks while the window is hidden or minimized; the deadline
+        # keeps running, so minimizing does not stop the player's clock
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._deadline is not None and not self.timer.isActive():
+            self.timer.start()
+            self.update_timer()  # Catch up on the time spent hidden
+
+    @pyqtSlot(Qt.ApplicationState)
+    def on_application_state_changed(self, state):
+        """
+        Stop the once-a-second tick while another application has focus. The
+        deadline keeps running, so the clock still counts down; on return one
+        catch-up tick relabels it (or ends the game if it ran out meanwhile).
+        """
+        if self._deadline is None:
+            return
+        if state == Qt.ApplicationState.ApplicationActive:
+            if self.isVisible() and not self.timer.isActive():
+                self.timer.start()
+                self.update_timer()
+        else:
+            self.timer.stop()
 
+    @pyqtSlot()
     def update_timer(self):
+        # Whole seconds rounded up, as in start_timer: the clock reads 0 only once time is out
+        remaining = max(0, math.ceil(self._deadline - time.monotonic()))
         if self.current_timer == "black":
-            self.black_timer -= 1
-            if self.black_timer <= 0:
+            if remaining <= 0:
                 self.timer.stop()
-                QMessageBox.warning(self, "Game Over", "Black ran out of time! White wins!")
+                self.show_message(self._warn_box, "Game Over", "Black ran out of time! White wins!")
                 self.reset_game()
                 return
+            if remaining == self.black_timer:
+                return  # Same whole second as last tick; nothing to relabel
+            self.black_timer = remaining
         else:
-            self.white_timer -= 1
-            if self.white_timer <= 0:
+            if remaining <= 0:
                 self.timer.stop()
-                QMessageBox.warning(self, "Game Over", "White ran out of time! Black wins!")
+                self.show_message(self._warn_box, "Game Over", "White ran out of time! Black wins!")
                 self.reset_game()
                 return
+            if remaining == self.white_timer:
+                return
+            self.white_timer = remaining
         self.update_timer_labels()
 
     def update_timer_labels(self):
-        self.black_timer_label.setText(
-            f"Black Timer: {self.black_timer // 60:02}:{self.black_timer % 60:02}"
-        )
-        self.white_timer_label.setText(
-            f"White Timer: {self.white_timer // 60:02}:{self.white_timer % 60:02}"
-        )
+        # Only the running clock changes per tick; leave the other label alone
+        if self.black_timer != self._shown_black_timer:
+            self._shown_black_timer = self.black_timer
+            self.black_timer_label.setText("Black Timer: " + CLOCK_TEXT[self.black_timer])
+        if self.white_timer != self._shown_white_timer:
+            self._shown_white_timer = self.white_timer
+            self.white_timer_label.setText("White Timer: " + CLOCK_TEXT[self.white_timer])
 
     def update_board_ui(self):
-        board_state = self.logic.get_board_state()
-        for (r, c), val in board_state.items():
-            self.board_widget.grid[r][c] = val
-        self.board_widget.update()
+        # Only write and repaint the cells whose value actually changed: XOR the
+        # logic's bitboards against the ones last shown and visit the set bits
+        black, white = self.logic.get_bitboards()
+        shown_black, shown_white = self._shown_bitboards
+        changed = (black ^ shown_black) | (white ^ shown_white)
+        set_cell = self.board_widget.set_cell
+        update_cell = self.board_widget.update_cell
+        size = self.board_size
+        while changed:
+            lowest = changed & -changed
+            changed ^= lowest
+            r, c = divmod(lowest.bit_length() - 1, size)
+            set_cell(r, c, 1 if black & lowest else -1 if white & lowest else 0)
+            update_cell(r, c)
+        self._shown_bitboards = (black, white)
+
+    def update_board_ui_delta(self, changes):
+        """
+        Apply known (row, col, value) changes to the board widget, repainting
+        only those cells. Moves, undo and redo know exactly which cells they
+        touched; update_board_ui remains the full resync for reset/handicap.
+        """
+        set_cell = self.board_widget.set_cell
+        update_cell = self.board_widget.update_cell
+        for (r, c, val) in changes:
+            set_cell(r, c, val)
+            update_cell(r, c)
+        self._shown_bitboards = self.logic.get_bitboards()
+
+    def _mark_dirty(self, bits):
+        """
+        Request a refresh of the given DIRTY_* label groups. Requests made while
+        handling one event are merged and applied once from the event loop.
+        The board itself is always synced immediately, since input checks read it.
+        """
+        if not self._dirty:
+            QTimer.singleShot(0, self._flush_dirty)
+        self._dirty |= bits
+
+    @pyqtSlot()
+    def _flush_dirty(self):
+        dirty, self._dirty = self._dirty, 0
+        if dirty & DIRTY_LABELS:
+            self.update_labels()
+        if dirty & DIRTY_TIMER:
+            self.update_timer_labels()
 
     def update_labels(self):
+        # setText invalidates the layout even for identical text, so only
+        # push strings that differ from what the labels already show
         current_player = "Black" if self.logic.get_current_player() == 1 else "White"
-        self.turn_label.setText(f"{current_player}'s Turn")
+        turn_text = f"{current_player}'s Turn"
+        if turn_text != self._shown_turn_text:
+            self._shown_turn_text = turn_text
+            self.turn_label.setText(turn_text)
 
         scores = self.logic.get_scores()
         black_score = scores["black"]
         white_score = scores["white"]
 
-        captures_black = self.logic.captured_stones["black"]
-        captures_white = self.logic.captured_stones["white"]
+        captures = self.logic.captured_stones
+        captures_black = captures["black"]
+        captures_white = captures["white"]
 
-        self.score_label.setText(
+        score_text = (
             f"Black: {black_score} | White: {white_score}\n"
             f"Captured by Black: {captures_black} | Captured by White: {captures_white}"
         )
+        if score_text != self._shown_score_text:
+            self._shown_score_text = score_text
+            self.score_label.setText(score_text)
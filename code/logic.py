@@ -8,6 +8,49 @@ Contains the core Go game rules logic:
 - Passing & game over checks
 """
 
+import random
+from array import array
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _neighbors_for(size, row, col):
+    """
+    Return the tuple of in-bounds orthogonal neighbors of (row, col) on a size x size board.
+    Cached at module level so every GameLogic of the same size shares the tuples.
+    """
+    neighbors = []
+    if row > 0:
+        neighbors.append((row - 1, col))
+    if row < size - 1:
+        neighbors.append((row + 1, col))
+    if col > 0:
+        neighbors.append((row, col - 1))
+    if col < size - 1:
+        neighbors.append((row, col + 1))
+    return tuple(neighbors)
+
+
+@lru_cache(maxsize=None)
+def _neighbor_index_table(size):
+    """
+    Return, for every flat index row * size + col, the tuple of its in-bounds
+    orthogonal neighbor indices. Built once per board size and shared.
+    """
+    return tuple(tuple(r * size + c for (r, c) in _neighbors_for(size, row, col))
+                 for row in range(size)
+                 for col in range(size))
+
+
+@lru_cache(maxsize=None)
+def _neighbor_mask_table(size):
+    """
+    Return, for every flat index, the bitboard of its in-bounds orthogonal neighbors.
+    """
+    return tuple(sum(1 << neighbor for neighbor in neighbors)
+                 for neighbors in _neighbor_index_table(size))
+
+
 class GameLogic:
     def __init__(self, board_size):
         """
@@ -15,38 +58,181 @@ class GameLogic:
         current_player = 1 (Black), -1 (White).
         pass_count tracks consecutive passes. 
         black_score and white_score track the raw count of captures only (for partial scoring).
-        captured_stones is a dict to track how many stones each color has captured.
-        previous_states is used to detect KO.
+        captured_stones is a dict to track how many stones each color has captured
+        (a view of _captured, where the counts are kept; [0] = Black, [1] = White).
+        previous_states is used to detect KO; it holds the Zobrist keys of past positions.
+        _zkey is a Zobrist hash of the position, updated incrementally whenever a
+        stone is added or removed; it keys KO history and caches of position-derived results.
         """
         self.board_size = board_size
+        # Points are addressed by flat index row * board_size + col throughout
+        # Neighbor table: _neighbors[index] is a tuple of in-bounds orthogonal neighbor indices
+        self._neighbors = _neighbor_index_table(board_size)
+        # _neighbor_masks[index] is the same neighbors as a bitboard
+        self._neighbor_masks = _neighbor_mask_table(board_size)
+        # Zobrist table: one random 64-bit key per (index, color); index 0 = Black, 1 = White
+        self._zobrist = [(random.getrandbits(64), random.getrandbits(64))
+                         for _ in range(board_size * board_size)]
+        # Bitboard masks for whole-board shifts (see _dilate)
+        self._full_mask = (1 << (board_size * board_size)) - 1
+        first_col = sum(1 << (r * board_size) for r in range(board_size))
+        self._not_first_col = self._full_mask & ~first_col
+        self._not_last_col = self._full_mask & ~(first_col << (board_size - 1))
         self.reset_game()
 
     def reset_game(self):
         """
         Reset the game state to the initial state, clearing board, pass counts, scores, etc.
         """
-        self.board_state = [[0] * self.board_size for _ in range(self.board_size)]
+        # One signed byte per point, flat index row * board_size + col
+        self.board_state = array('b', bytes(self.board_size * self.board_size))
         self.current_player = 1  # 1 for Black, -1 for White
         self.pass_count = 0
         self.black_score = 0
         self.white_score = 0
-        self.previous_states = []  # For KO rule prevention
-        self.captured_stones = {"black": 0, "white": 0}
+        self.previous_states = []  # Zobrist keys for KO rule prevention, in move order (undo pops the last)
+        self._previous_state_set = set()  # Same keys, for O(1) KO lookups
+        self._captured = [0, 0]  # Stones captured by [Black, White]; see captured_stones
+        self._zkey = 0  # Zobrist hash of the empty board
+        # Bitboards: bit row * board_size + col set where a stone stands; [0] = Black, [1] = White
+        self._bitboards = [0, 0]
+        self.stone_count = 0  # Stones currently on the board
+        self._territory_cache = {}  # _zkey -> calculate_territories() result
+        self._reset_groups()
+
+    def _reset_groups(self):
+        """
+        Empty the group tracker: a disjoint-set forest over flat indices
+        row * board_size + col. Each root keeps its group's stones and liberties
+        as bitboards, so merging groups is an OR and a capture test is a zero check.
+        """
+        self._parent = list(range(self.board_size * self.board_size))
+        self._group_stones = {}  # root -> bitboard of the group's stones
+        self._group_libs = {}  # root -> bitboard of the group's liberties
+        # Set by undo/redo, which can split groups; the tracker is then rebuilt
+        # on the next placement, so a run of undos/redos costs one rebuild
+        self._groups_stale = False
+
+    def _rebuild_groups(self):
+        """
+        Rebuild the group tracker from board_state, after changes (undo, redo)
+        that can split groups, which a disjoint-set cannot do incrementally.
+        """
+        self._reset_groups()
+        for index, value in enumerate(self.board_state):
+            if value != 0:
+                self._add_to_groups(index, value)
+
+    def _sync_groups(self):
+        """
+        Rebuild the group tracker if undo/redo left it stale. Must run before a
+        stone is written to board_state.
+        """
+        if self._groups_stale:
+            self._rebuild_groups()
+
+    def _find(self, i):
+        """
+        Return the root of the group containing flat index i (with path halving).
+        """
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _add_to_groups(self, index, color):
+        """
+        Register the stone just put on index with the group tracker: it
+        starts as its own group, takes this point from the liberties of every
+        adjacent group and merges with adjacent groups of its color.
+        The stone must already be in board_state and the bitboards.
+        Returns the root of the stone's group.
+        """
+        board = self.board_state
+        parent = self._parent
+        group_stones = self._group_stones
+        group_libs = self._group_libs
+        root = index
+        bit = 1 << index
+        black, white = self._bitboards
+        group_stones[root] = bit
+        group_libs[root] = self._neighbor_masks[index] & ~(black | white)
+
+        for neighbor in self._neighbors[index]:
+            value = board[neighbor]
+            if value == 0:
+                continue
+            other = self._find(neighbor)
+            if other == root or other not in group_stones:
+                continue  # Already merged, or not registered yet (during a rebuild)
+            group_libs[other] &= ~bit
+            if value == color:
+                # Union by size: hang the smaller group under the larger one
+                if bin(group_stones[other]).count("1") < bin(group_stones[root]).count("1"):
+                    root, other = other, root
+                parent[other] = root
+                group_stones[root] |= group_stones.pop(other)
+                group_libs[root] |= group_libs.pop(other)
+        return root
+
+    def _toggle_stone(self, index, color):
+        """
+        XOR the stone of the given color at index into or out of the
+        Zobrist key and that color's bitboard. Called for every stone added or removed.
+        """
+        plane = 0 if color == 1 else 1
+        self._zkey ^= self._zobrist[index][plane]
+        self._bitboards[plane] ^= 1 << index
+
+    @property
+    def captured_stones(self):
+        """
+        Stones captured so far by each color, as {"black": n, "white": n}.
+        """
+        return {"black": self._captured[0], "white": self._captured[1]}
+
+    def get_bitboards(self):
+        """
+        Return (black, white) as ints with bit row * board_size + col set for
+        each stone of that color; cheap to diff against an earlier pair with XOR.
+        """
+        return self._bitboards[0], self._bitboards[1]
 
     def get_board_state_snapshot(self):
         """
-        Return an immutable snapshot (tuple of tuples) of the board to check for repeated states (KO).
+        Return an immutable snapshot (the board's raw bytes) of the board.
         """
-        return tuple(tuple(row) for row in self.board_state)
+        return self.board_state.tobytes()
+
+    def _push_state(self, key):
+        """
+        Record the Zobrist key of a position in previous_states and the KO lookup set.
+        """
+        self.previous_states.append(key)
+        self._previous_state_set.add(key)
 
     def get_board_state(self):
         """
         Return the current board state as a dictionary {(r, c): value}
         for easier consumption in the UI.
         """
-        return {(r, c): self.board_state[r][c]
-                for r in range(self.board_size)
-                for c in range(self.board_size)}
+        size = self.board_size
+        return {divmod(index, size): value for index, value in enumerate(self.board_state)}
+
+    def get_nonempty_cells(self):
+        """
+        Return {(r, c): value} for occupied points only. Walks the set bits of
+        the bitboards, so the cost follows the number of stones, not the board area.
+        """
+        size = self.board_size
+        cells = {}
+        for value, stones in ((1, self._bitboards[0]), (-1, self._bitboards[1])):
+            while stones:
+                lowest = stones & -stones
+                stones ^= lowest
+                cells[divmod(lowest.bit_length() - 1, size)] = value
+        return cells
 
     def place_stone(self, row, col):
         """
@@ -63,39 +249,46 @@ class GameLogic:
         """
         if row < 0 or col < 0 or row >= self.board_size or col >= self.board_size:
             return None  # Out of bounds
-        if self.board_state[row][col] != 0:
+        index = row * self.board_size + col
+        if self.board_state[index] != 0:
             return None  # Position already occupied
+        self._sync_groups()
 
         # Temporarily place the stone
-        self.board_state[row][col] = self.current_player
+        self.board_state[index] = self.current_player
 
         # Check for suicide
         if self.is_suicide(row, col):
             # Undo the move
-            self.board_state[row][col] = 0
+            self.board_state[index] = 0
             return None
 
-        # Check for KO (repeated board state)
-        snapshot_after_move = self.get_board_state_snapshot()
-        if snapshot_after_move in self.previous_states:
+        # Check for KO (repeated board state), by the Zobrist key of the board with this stone
+        plane = 0 if self.current_player == 1 else 1
+        key_after_move = self._zkey ^ self._zobrist[index][plane]
+        if key_after_move in self._previous_state_set:
             # Undo the move
-            self.board_state[row][col] = 0
+            self.board_state[index] = 0
             return None
 
+        self._toggle_stone(index, self.current_player)
+        self._add_to_groups(index, self.current_player)
+
         # Capture opponent stones
         captured_positions = self.capture_stones(row, col)
         num_captured = len(captured_positions)
+        self.stone_count += 1 - num_captured
 
         # Update the scores for the current_player
         if self.current_player == 1:
             self.black_score += num_captured
-            self.captured_stones["black"] += num_captured
+            self._captured[0] += num_captured
         else:
             self.white_score += num_captured
-            self.captured_stones["white"] += num_captured
+            self._captured[1] += num_captured
 
         # Store this new state for KO rule prevention
-        self.previous_states.append(snapshot_after_move)
+        self._push_state(key_after_move)
 
         # Switch the player
         self.current_player *= -1
@@ -104,6 +297,25 @@ class GameLogic:
 
         return captured_positions
 
+    def place_handicap(self, coords):
+        """
+        Place Black handicap stones at each (row, col) in coords in one pass.
+        Meant for an empty board, where every placement is legal and nothing can
+        be captured, so the suicide/KO/capture checks of place_stone are skipped.
+        current_player is left untouched; the caller decides who moves next.
+        """
+        size = self.board_size
+        self._sync_groups()
+        for (row, col) in coords:
+            index = row * size + col
+            self.board_state[index] = 1
+            self._toggle_stone(index, 1)
+            self._add_to_groups(index, 1)
+        self.stone_count += len(coords)
+        if coords:
+            self._push_state(self._zkey)
+            self.pass_count = 0
+
     def capture_stones(self, row, col):
         """
         Capture any opponent stones that have no liberties after the current_player's move at (row,col).
@@ -111,18 +323,37 @@ class GameLogic:
         """
         opponent = -self.current_player
         captured_positions = []
+        size = self.board_size
+        board = self.board_state
+        group_stones = self._group_stones
+        group_libs = self._group_libs
 
         # For each neighbor of the newly placed stone:
-        neighbors = self.get_neighbors(row, col)
-        for (nr, nc) in neighbors:
-            if self.board_state[nr][nc] == opponent:
-                # Check if that group of opponent stones has zero liberties
-                visited = set()
-                if self.count_liberties(nr, nc, visited) == 0:
-                    # All stones in that group are captured
-                    for (rr, cc) in visited:
-                        self.board_state[rr][cc] = 0
-                    captured_positions.extend(visited)
+        for neighbor in self._neighbors[row * size + col]:
+            if board[neighbor] != opponent:
+                continue
+            root = self._find(neighbor)
+            if group_libs[root]:
+                continue
+            # The group has no liberties left: remove all of its stones
+            del group_libs[root]
+            stones = group_stones.pop(root)
+            group = []
+            while stones:
+                lowest = stones & -stones
+                stones ^= lowest
+                index = lowest.bit_length() - 1
+                board[index] = 0
+                self._toggle_stone(index, opponent)
+                self._parent[index] = index
+                group.append(index)
+            # Each emptied point becomes a liberty of the groups around it
+            for index in group:
+                bit = 1 << index
+                for adjacent in self._neighbors[index]:
+                    if board[adjacent] != 0:
+                        group_libs[self._find(adjacent)] |= bit
+            captured_positions.extend(divmod(index, size) for index in group)
 
         return captured_positions
 
@@ -132,24 +363,26 @@ class GameLogic:
         for that stone or group, without capturing any opposing stones.
         If so, it's a suicide move.
         """
-        # If we see that the group formed by (row,col) has zero liberties,
-        # and we do NOT capture any opponent stones that would otherwise free us, it's suicide.
-        visited = set()
-        libs_before_capture = self.count_liberties(row, col, visited)
-        if libs_before_capture > 0:
-            return False  # We have at least one liberty => not suicide
-
-        # Check if we would capture something that frees us. 
-        # We can do a quick check by seeing if any neighbor is an opponent group with zero liberties.
-        # If so, that group would be removed, giving us liberties => not suicide.
-        opponent = -self.current_player
-        neighbors = self.get_neighbors(row, col)
-        for (nr, nc) in neighbors:
-            if self.board_state[nr][nc] == opponent:
-                visited_opp = set()
-                if self.count_liberties(nr, nc, visited_opp) == 0:
-                    # We would capture that group => not suicide
-                    return False
+        # The stone lives if it touches an empty point, joins a group of its own
+        # color that keeps another liberty, or takes the last liberty of an
+        # opponent group (which is then captured). The tracker still describes
+        # the board without this stone, so each check is one lookup.
+        index = row * self.board_size + col
+        black, white = self._bitboards
+        if self._neighbor_masks[index] & ~(black | white):
+            return False  # Touches an empty point (the common case): one AND, no group lookups
+
+        board = self.board_state
+        color = self.current_player
+        bit = 1 << index
+        for neighbor in self._neighbors[index]:
+            value = board[neighbor]
+            liberties = self._group_libs[self._find(neighbor)] & ~bit
+            if value == color:
+                if liberties:
+                    return False  # Our group keeps a liberty elsewhere
+            elif not liberties:
+                return False  # We capture that group => not suicide
 
         # If we get here, it means we have zero liberties and we do not capture any group => suicide
         return True
@@ -157,48 +390,60 @@ class GameLogic:
     def count_liberties(self, row, col, visited=None):
         """
         Count the number of liberties of the group containing the stone at (row, col).
-        A liberty is an empty adjacent cell. 
-        visited is a set used in DFS to avoid repeated checks.
+        A liberty is an empty adjacent cell; each is counted once.
+        Reads board_state directly, so it also works on a temporarily placed stone.
+        If visited (a set) is given, the (row, col) of every stone in the group is
+        added to it, and a stone already in visited counts 0 liberties.
         """
-        if visited is None:
-            visited = set()
-        if (row, col) in visited:
+        if visited is not None and (row, col) in visited:
             return 0
+        size = self.board_size
+        liberties, stones = self._group_liberties(row * size + col)
+        if visited is not None:
+            visited.update(divmod(index, size) for index in stones)
+        return liberties
 
-        visited.add((row, col))
-        color = self.board_state[row][col]
+    def _group_liberties(self, start):
+        """
+        Walk the group containing flat index start with an explicit stack.
+        Returns (liberties, stones): the number of distinct empty points
+        adjacent to the group and the list of the group's indices.
+        """
+        board = self.board_state
+        neighbors = self._neighbors
+        color = board[start]
+        seen = bytearray(len(board))
+        seen[start] = 1
+        stones = [start]
+        stack = [start]
         liberties = 0
-
-        for (nr, nc) in self.get_neighbors(row, col):
-            if self.board_state[nr][nc] == 0:
-                liberties += 1
-            elif self.board_state[nr][nc] == color:
-                # Recursively check connected stones of same color
-                liberties += self.count_liberties(nr, nc, visited)
-
-        return liberties
+        while stack:
+            index = stack.pop()
+            for neighbor in neighbors[index]:
+                if seen[neighbor]:
+                    continue
+                value = board[neighbor]
+                if value == 0:
+                    seen[neighbor] = 1
+                    liberties += 1
+                elif value == color:
+                    seen[neighbor] = 1
+                    stones.append(neighbor)
+                    stack.append(neighbor)
+        return liberties, stones
 
     def get_neighbors(self, row, col):
         """
         Return the four orthogonal neighbors of (row, col) that are in bounds.
+        Looked up from the module-level cache shared by all boards of this size.
         """
-        neighbors = []
-        if row > 0:
-            neighbors.append((row - 1, col))
-        if row < self.board_size - 1:
-            neighbors.append((row + 1, col))
-        if col > 0:
-            neighbors.append((row, col - 1))
-        if col < self.board_size - 1:
-            neighbors.append((row, col + 1))
-        return neighbors
+        return _neighbors_for(self.board_size, row, col)
 
     def is_ko(self):
         """
         (Unused in final) We do the immediate check in place_stone instead.
         """
-        current_state = self.get_board_state_snapshot()
-        return current_state in self.previous_states
+        return self._zkey in self._previous_state_set
 
     def pass_turn(self):
         """
@@ -221,78 +466,137 @@ class GameLogic:
          - Restore any captured stones
          - Adjust the player's capture count accordingly
          - Switch current_player back
-         - We also remove the last snapshot from previous_states to revert Ko logic.
+         - We also remove the last position key from previous_states to revert Ko logic.
         """
+        size = self.board_size
         # Remove the placed stone
-        self.board_state[row][col] = 0
+        self.board_state[row * size + col] = 0
+        self._toggle_stone(row * size + col, color_of_move)
 
         # Re-add any captured stones for the opponent
         opponent = -color_of_move
         for (rr, cc) in captured_positions:
-            self.board_state[rr][cc] = opponent
+            self.board_state[rr * size + cc] = opponent
+            self._toggle_stone(rr * size + cc, opponent)
+        self.stone_count += len(captured_positions) - 1
 
         # Decrease the capturing player's score accordingly
         # Because we are undoing that capture
         if color_of_move == 1:
             self.black_score -= len(captured_positions)
-            self.captured_stones["black"] -= len(captured_positions)
+            self._captured[0] -= len(captured_positions)
         else:
             self.white_score -= len(captured_positions)
-            self.captured_stones["white"] -= len(captured_positions)
+            self._captured[1] -= len(captured_positions)
+
+        self._groups_stale = True
 
         # Switch current_player back to the undone player
         self.current_player = color_of_move
 
-        # Also remove the last board snapshot from previous_states if present
+        # Also remove the last position key from previous_states if present
         # so that the next placement won't fail KO rule incorrectly.
         if self.previous_states:
-            self.previous_states.pop()
+            self._previous_state_set.discard(self.previous_states.pop())
+
+    def replay_stone(self, row, col, color_of_move, captured_positions):
+        """
+        Redo a move previously undone with undo_stone, without re-checking it:
+         - Place the stone and remove the captured stones recorded for it
+         - Add the captures back to the mover's score
+         - Push the same KO key place_stone recorded
+         - Hand the turn to the opponent, reset pass_count
+        The move was legal when first played and the position has been restored
+        by undo, so no suicide/KO/liberty search is needed.
+        If the board no longer matches the record (the point is taken, or a
+        recorded capture is not an opponent stone), the move goes through
+        place_stone for color_of_move instead.
+        Returns the captured positions, or None if the move is now illegal.
+        """
+        size = self.board_size
+        opponent = -color_of_move
+        board = self.board_state
+        if board[row * size + col] != 0 or any(board[rr * size + cc] != opponent
+                                               for (rr, cc) in captured_positions):
+            previous_player = self.current_player
+            self.current_player = color_of_move
+            replayed = self.place_stone(row, col)
+            if replayed is None:
+                self.current_player = previous_player
+            return replayed
+
+        self.board_state[row * size + col] = color_of_move
+        self._toggle_stone(row * size + col, color_of_move)
+        self._push_state(self._zkey)
+
+        for (rr, cc) in captured_positions:
+            self.board_state[rr * size + cc] = 0
+            self._toggle_stone(rr * size + cc, opponent)
+        self.stone_count += 1 - len(captured_positions)
+        self._groups_stale = True
+
+        if color_of_move == 1:
+            self.black_score += len(captured_positions)
+            self._captured[0] += len(captured_positions)
+        else:
+            self.white_score += len(captured_positions)
+            self._captured[1] += len(captured_positions)
+
+        self.current_player = opponent
+        self.pass_count = 0
+        return captured_positions
 
     def calculate_territories(self):
         """
         Calculates territory on the current board.
         Returns a dict { 'black': x, 'white': y }
-        """
-        visited = set()
+        Results are memoized per position (Zobrist key), so repeated score
+        queries between moves, or after an undo, skip the flood fill.
+        """
+        cached = self._territory_cache.get(self._zkey)
+        if cached is not None:
+            return dict(cached)
+
+        # Flood fill on bitboards: each region of empty points is grown from one
+        # seed bit by whole-board shifts until it stops changing, so every step
+        # advances the whole frontier at once instead of one cell per iteration
+        black, white = self._bitboards
+        empty = self._full_mask & ~(black | white)
+        dilate = self._dilate
         territories = {"black": 0, "white": 0}
 
-        for r in range(self.board_size):
-            for c in range(self.board_size):
-                if (r, c) not in visited and self.board_state[r][c] == 0:
-                    territory, owner = self._explore_territory(r, c, visited)
-                    if owner == 1:
-                        territories["black"] += territory
-                    elif owner == -1:
-                        territories["white"] += territory
-        return territories
-
-    def _explore_territory(self, row, col, visited):
-        """
-        BFS/DFS to find connected empty space and see which color encloses it.
-        If exactly one color is touching this empty space, it's that color's territory.
-        If more than one color touches it, it's neutral.
-        """
-        queue = [(row, col)]
-        visited.add((row, col))
-        territory_size = 0
-        bordering_colors = set()
-
-        while queue:
-            r, c = queue.pop(0)
-            territory_size += 1
-
-            for (nr, nc) in self.get_neighbors(r, c):
-                if (nr, nc) not in visited:
-                    visited.add((nr, nc))
-                    if self.board_state[nr][nc] == 0:
-                        queue.append((nr, nc))
-                    else:
-                        bordering_colors.add(self.board_state[nr][nc])
-
-        if len(bordering_colors) == 1:
-            return (territory_size, bordering_colors.pop())
-        else:
-            return (territory_size, 0)  # neutral or multiple colors
+        while empty:
+            region = empty & -empty  # lowest unexplored empty point
+            while True:
+                grown = region | (dilate(region) & empty)
+                if grown == region:
+                    break
+                region = grown
+            empty ^= region
+
+            # If exactly one color touches the region it is that color's territory;
+            # a stone bordering several regions counts towards each of them
+            border = dilate(region)
+            touches_black = border & black
+            touches_white = border & white
+            if touches_black and not touches_white:
+                territories["black"] += bin(region).count("1")
+            elif touches_white and not touches_black:
+                territories["white"] += bin(region).count("1")
+        self._territory_cache[self._zkey] = territories
+        return dict(territories)
+
+    def _dilate(self, bits):
+        """
+        Return the bitboard of points orthogonally adjacent to any point in bits
+        (may include points of bits itself). Column masks stop shifts from
+        wrapping from one row's edge into the next row.
+        """
+        size = self.board_size
+        return (((bits & self._not_last_col) << 1)
+                | ((bits & self._not_first_col) >> 1)
+                | ((bits << size) & self._full_mask)
+                | (bits >> size))
 
     def get_current_player(self):
         """
@@ -308,8 +612,8 @@ class GameLogic:
         (Komi is not applied here; this is for 'in-progress' display.)
         """
         territories = self.calculate_territories()
-        partial_black = self.black_score + self.captured_stones["black"] + territories["black"]
-        partial_white = self.white_score + self.captured_stones["white"] + territories["white"]
+        partial_black = self.black_score + self._captured[0] + territories["black"]
+        partial_white = self.white_score + self._captured[1] + territories["white"]
         return {
             "black": partial_black,
             "white": partial_white
@@ -320,8 +624,8 @@ class GameLogic:
         Return final scores, factoring in a Komi of 6.5 for White.
         e.g. for end-of-game display.
         """
-        final_black_score = self.black_score + self.captured_stones["black"] + territories["black"]
-        final_white_score = self.white_score + self.captured_stones["white"] + territories["white"] + 6.5
+        final_black_score = self.black_score + self._captured[0] + territories["black"]
+        final_white_score = self.white_score + self._captured[1] + territories["white"] + 6.5
         return {
             "black": final_black_score,
             "white": final_white_score
@@ -6,6 +6,10 @@ you can rely on logic.py's internal approach.
 """
 
 class ScoreBoard:
+    # Fixed set of fields: no per-instance __dict__
+    __slots__ = ("black_score", "white_score", "captured_black", "captured_white",
+                 "territory_black", "territory_white")
+
     def __init__(self):
         """
         Initialize the scoreboard with basic zeroed-out fields.
@@ -14,7 +18,15 @@ class ScoreBoard:
         self.white_score = 0
         self.captured_black = 0  # Stones captured by White
         self.captured_white = 0  # Stones captured by Black
-        self.territories = {"black": 0, "white": 0}
+        self.territory_black = 0
+        self.territory_white = 0
+
+    @property
+    def territories(self):
+        """
+        Territory counts as {"black": n, "white": n}.
+        """
+        return {"black": self.territory_black, "white": self.territory_white}
 
     def add_score(self, player, points):
         """
@@ -39,21 +51,40 @@ class ScoreBoard:
         """
         Calculate the final score with captured stones + territory + komi for White.
         """
-        final_black_score = self.black_score + self.captured_black + self.territories["black"]
-        final_white_score = self.white_score + self.captured_white + self.territories["white"] + komi
+        final_black_score = self.black_score + self.captured_black + self.territory_black
+        final_white_score = self.white_score + self.captured_white + self.territory_white + komi
         return {
             "black": final_black_score,
             "white": final_white_score
         }
 
+    def winner(self, komi_half=13):
+        """
+        Return the winner as 1 (Black), -1 (White) or 0 (tie), using integer
+        arithmetic only: komi_half is twice the komi (13 = 6.5), and both
+        totals are doubled instead of adding a float.
+        """
+        black_half = 2 * (self.black_score + self.captured_black + self.territory_black)
+        white_half = 2 * (self.white_score + self.captured_white + self.territory_white) + komi_half
+        return (black_half > white_half) - (black_half < white_half)
+
     def update_territory(self, player, points):
         """
         Update the territory count for a given player (1=Black, -1=White).
         """
         if player == 1:
-            self.territories["black"] += points
+            self.territory_black += points
         else:
-            self.territories["white"] += points
+            self.territory_white += points
+
+    def apply_territory_array(self, owners):
+        """
+        Add a whole board of territory in one call. owners holds one entry per
+        point (1=Black, -1=White, 0=neutral), e.g. a list or array('b');
+        counted with the sequence's own C-level count().
+        """
+        self.territory_black += owners.count(1)
+        self.territory_white += owners.count(-1)
 
     def reset_scores(self):
         """
@@ -63,7 +94,8 @@ class ScoreBoard:
         self.white_score = 0
         self.captured_black = 0
         self.captured_white = 0
-        self.territories = {"black": 0, "white": 0}
+        self.territory_black = 0
+        self.territory_white = 0
 
     def get_scores(self):
         """
@@ -84,7 +116,7 @@ class ScoreBoard:
         return (
             f"ScoreBoard("
             f"Black Score: {self.black_score}, Captured by Black: {self.captured_black}, "
-            f"Territories(Black): {self.territories['black']} | "
+            f"Territories(Black): {self.territory_black} | "
             f"White Score: {self.white_score}, Captured by White: {self.captured_white}, "
-            f"Territories(White): {self.territories['white']})"
+            f"Territories(White): {self.territory_white})"
         )